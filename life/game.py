@@ -36,17 +36,20 @@ class Game:
         self.__screen_dimensions = Game.__get_screen_dimensions()
         self.__validate_cell_size(cell_size)
         self.__cell_size = cell_size
-        if initial_state is not None:
-            self.world = World(initial_state)
-        else:
-            random_state = self.__get_random_state(0.075)
-            self.world = World(random_state)
+        self.__grid_dimensions = Coordinate(*(d // cell_size for d in self.__screen_dimensions))
+        if initial_state is None:
+            initial_state = self.__get_random_state(0.075)
+        self.world = World(initial_state, dimensions=self.__grid_dimensions)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def __get_screen_dimensions() -> Coordinate:
         """
         returns screen dimensions in pixels as a tuple of form (width, height)
 
+        The result is cached after the first call as initializing Pygame to query the display is
+        expensive and the screen dimensions do not change while the game is running.
+
         :returns screen dimensions in pixels as a tuple of form (width, height)
         """
         pygame.init()
@@ -58,14 +61,14 @@ class Game:
         """
         validates a given cell_size
 
-        :raises ValueError if cell_size is negative or cell_size is too big for screen
+        :raises ValueError if cell_size is not positive or cell_size is too big for screen
 
         :param cell_size: the desired size of a rendered cell in pixels
 
         :returns None
         """
-        if cell_size < 0:
-            raise ValueError("The cell_size cannot be negative.")
+        if cell_size < 1:
+            raise ValueError("The cell_size must be positive.")
 
         cell_is_too_big = any(dim for dim in self.__screen_dimensions if cell_size > dim)
         if cell_is_too_big:
@@ -84,16 +87,15 @@ class Game:
         if density < 0 or density > 1:
             raise ValueError("The value of density must be in the interval [0, 1].")
 
-        screen_area = functools.reduce(operator.mul, self.__screen_dimensions, 1)
-        cell_area = self.__cell_size ** 2
-        total_cells = screen_area // cell_area
+        total_cells = functools.reduce(operator.mul, self.__grid_dimensions, 1)
         desired_cells = int(total_cells * density)
-        max_coordinate = Coordinate(*(d // self.__cell_size for d in self.__screen_dimensions))
-        candidates = [
-            Coordinate(i, j)
-            for i in range(max_coordinate.x + 1) for j in range(max_coordinate.y + 1)
-        ]
-        state = set(rand.sample(candidates, desired_cells))
+        # cells are sampled by index into the grid of candidate coordinates rather than from a
+        # list of every candidate, which would have millions of elements for small cell sizes
+        column_length = self.__grid_dimensions.y
+        state = {
+            Coordinate(*divmod(index, column_length))
+            for index in rand.sample(range(total_cells), desired_cells)
+        }
         return state
 
     def play(self, delay: float) -> None:
@@ -104,35 +106,83 @@ class Game:
         the game window
 
         :param delay: the delay between iterations of the game loop in seconds (i.e. the approximate
-        delay between rendered frames)
+        delay between rendered frames). Time spent rendering and computing the next state counts
+        towards the delay, so each iteration takes the longer of the delay and that work.
 
         :returns None
         """
-        def scaled_coordinate(coordinate: Coordinate) -> Coordinate:
+        pygame.init()
+        surface = pygame.display.set_mode(self.__screen_dimensions, pygame.FULLSCREEN)
+        # only QUIT events are handled, so all other events are kept out of the event queue rather
+        # than left to accumulate in it and be scanned past on every frame
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(pygame.QUIT)
+        # colours are mapped to the surface's pixel format once rather than on every fill
+        colours = {
+            name: surface.map_rgb(rgb)
+            for name, rgb in {'white': (255,) * 3, 'green': (0, 175, 0)}.items()
+        }
+
+        def repaint_cells(dead: Set[Coordinate], live: Set[Coordinate]) -> None:
             """
-            returns the given coordinate scaled by cell_size and adjusted for a toroidal grid
+            repaints the cells at the given coordinates and updates only those cells on the display
+
+            :param dead: the coordinates of cells that have died
 
-            A coordinate is scaled by cell_size by multiplying each component by cell_size. A
-            coordinate is adjusted for a toroidal grid by taking the x-coordinate and y-coordinate
-            modulo the screen width and screen height respectively.
+            :param live: the coordinates of cells that have become live
 
-            :returns the given coordinate adjusted for toroidal geometry and scaled by cell_size
+            :returns None
             """
-            scaled_coordinate = (c * self.__cell_size for c in coordinate)
-            scaled_coordinate = tuple(
-                operator.mod(*entry) for entry in zip(scaled_coordinate, self.__screen_dimensions)
-            )
-            return scaled_coordinate
+            dirty_rects = [surface.fill(colours['white'], cell_rects[x][y]) for x, y in dead]
+            dirty_rects += [surface.fill(colours['green'], cell_rects[x][y]) for x, y in live]
+            pygame.display.update(dirty_rects)
 
-        pygame.init()
-        surface = pygame.display.set_mode(self.__screen_dimensions, pygame.FULLSCREEN)
-        colours = {'white': (255,) * 3, 'green': (0, 175, 0)}
-        while not pygame.event.get(pygame.QUIT):
-            surface.fill(colours['white'])
-            for coordinate in self.world.state:
-                cell = pygame.Rect(scaled_coordinate(coordinate), (self.__cell_size,) * 2)
-                pygame.draw.rect(surface, colours['green'], cell)
+        def repaint_pixels(dead: Set[Coordinate], live: Set[Coordinate]) -> None:
+            """
+            repaints the single pixel cells at the given coordinates and updates the display
+
+            Setting pixels directly avoids using a rect per cell, and a single update of the whole
+            display is cheaper than updating a 1x1 rect per changed cell.
+
+            :param dead: the coordinates of cells that have died
+
+            :param live: the coordinates of cells that have become live
+
+            :returns None
+            """
+            surface.lock()
+            for coordinate in dead:
+                surface.set_at(coordinate, colours['white'])
+            for coordinate in live:
+                surface.set_at(coordinate, colours['green'])
+            surface.unlock()
             pygame.display.flip()
+
+        if self.__cell_size == 1:
+            repaint = repaint_pixels
+        else:
+            # the rect for every cell in the grid is built once rather than on every repaint
+            cell_size = self.__cell_size
+            width, height = self.__grid_dimensions
+            cell_rects = [
+                [
+                    pygame.Rect(x * cell_size, y * cell_size, cell_size, cell_size)
+                    for y in range(height)
+                ]
+                for x in range(width)
+            ]
+            repaint = repaint_cells
+        surface.fill(colours['white'])
+        pygame.display.flip()
+        # only cells whose rendered colour changes between frames are repainted, as most cells in
+        # a typical state are unchanged from the previous state
+        previous_state = set()
+        clock = pygame.time.Clock()
+        frame_rate = 1 / delay if delay > 0 else 0
+        while not pygame.event.get(pygame.QUIT):
+            state = self.world.state
+            repaint(previous_state - state, state - previous_state)
+            previous_state = state
             self.world.next_state()
-            pygame.time.delay(int(delay * 1000))
+            clock.tick(frame_rate)
         pygame.quit()
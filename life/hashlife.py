@@ -0,0 +1,411 @@
+import functools
+from typing import Dict, List, Optional, Set, Tuple
+from life.coordinate import Coordinate
+
+
+class Node:
+    """
+    represents a square region of a 2D world as a node in a quadtree
+
+    Nodes are immutable and are never instantiated directly. Instead, every node is created by
+    HashLife, which interns nodes so that identical regions are represented by the same node. As
+    such, nodes are compared and hashed by identity, which is cheap, rather than by value.
+
+    fields:
+        level: int
+            the level of the node in the quadtree. A node of level k represents a square region
+            with sides of length 2^k. Level 0 nodes represent single cells.
+
+        nw: Optional[Node]
+            the north-west quadrant of the region, or None if level is 0
+
+        ne: Optional[Node]
+            the north-east quadrant of the region, or None if level is 0
+
+        sw: Optional[Node]
+            the south-west quadrant of the region, or None if level is 0
+
+        se: Optional[Node]
+            the south-east quadrant of the region, or None if level is 0
+
+        population: int
+            the number of live cells in the region
+    """
+    __slots__ = ('level', 'nw', 'ne', 'sw', 'se', 'population')
+
+    def __init__(
+            self, level: int, nw: Optional['Node'], ne: Optional['Node'], sw: Optional['Node'],
+            se: Optional['Node'], population: int
+    ) -> None:
+        """
+        instantiates a Node
+
+        :param level: the level of the node in the quadtree
+
+        :param nw: the north-west quadrant of the region, or None if level is 0
+
+        :param ne: the north-east quadrant of the region, or None if level is 0
+
+        :param sw: the south-west quadrant of the region, or None if level is 0
+
+        :param se: the south-east quadrant of the region, or None if level is 0
+
+        :param population: the number of live cells in the region
+
+        :returns None
+        """
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.population = population
+
+
+class HashLife:
+    """
+    represents a 2D world using Gosper's HashLife algorithm
+
+    The world is stored as a quadtree of interned nodes positioned on an unbounded plane. The
+    result of advancing any node by a power of 2 generations is memoized, so patterns with
+    repeated structure in space or time can be advanced by very large numbers of generations
+    quickly. Interned nodes and memoized results are owned by each instance. Neither is allowed to
+    hold more than max_cached_nodes entries: when either is full, both are discarded, even in the
+    middle of an advance. A pattern that needs many more nodes than that to advance is then
+    slower, as results that were discarded are computed again.
+
+    fields:
+        cells: Set[Coordinate]
+            the coordinates of the live cells in the world
+
+        cached_node_count: int
+            the number of nodes currently interned
+
+    methods:
+        advance(generations: int) -> None
+            updates the world by applying the rules of the game the given number of times
+    """
+    __DEAD = Node(0, None, None, None, None, 0)
+    __LIVE = Node(0, None, None, None, None, 1)
+
+    # masks selecting each cell in the 2x2 centre of a 4x4 grid packed in row-major order into a
+    # 16-bit int, paired with masks selecting the cells in its Moore neighbourhood. The centre
+    # cells are ordered north-west, north-east, south-west, south-east.
+    __CENTRE_MASKS = tuple(
+        (
+            1 << (4 * row + column),
+            sum(
+                1 << (4 * (row + row_offset) + column + column_offset)
+                for row_offset in range(-1, 2)
+                for column_offset in range(-1, 2)
+                if not (row_offset == column_offset == 0)
+            ),
+        )
+        for row in range(1, 3)
+        for column in range(1, 3)
+    )
+
+    def __init__(self, live_cells: Set[Coordinate], max_cached_nodes: int = 2 ** 18) -> None:
+        """
+        instantiates a HashLife
+
+        :param live_cells: the coordinates of the live cells in the world
+
+        :param max_cached_nodes: the largest number of interned nodes, and of memoized results,
+        that are kept at once
+
+        :returns None
+        """
+        self.__max_cached_nodes = max_cached_nodes
+        self.__nodes: Dict[Tuple[Node, Node, Node, Node], Node] = {}
+        self.__successors: Dict[Tuple[Node, int], Node] = {}
+        if live_cells:
+            min_x = min(x for x, _ in live_cells)
+            min_y = min(y for _, y in live_cells)
+            max_x = max(x for x, _ in live_cells)
+            max_y = max(y for _, y in live_cells)
+            side_length = max(max_x - min_x, max_y - min_y) + 1
+            level = max(side_length - 1, 1).bit_length()
+        else:
+            min_x, min_y, level = 0, 0, 1
+        self.__root = self.__build(list(live_cells), min_x, min_y, level)
+        self.__origin = Coordinate(min_x, min_y)
+
+    def __build(self, live_cells: List[Coordinate], x: int, y: int, level: int) -> Node:
+        """
+        returns a node of the given level with the given live cells
+
+        :param live_cells: the coordinates of the live cells in the region represented by the node
+
+        :param x: the x-coordinate of the north-west corner of the region
+
+        :param y: the y-coordinate of the north-west corner of the region
+
+        :param level: the level of the node
+
+        :returns a node of the given level with the given live cells
+        """
+        if not live_cells:
+            return HashLife.__empty(level)
+        if level == 0:
+            return HashLife.__LIVE
+
+        half = 1 << (level - 1)
+        quadrants = [[], [], [], []]
+        for cell in live_cells:
+            quadrants[(cell.x >= x + half) + 2 * (cell.y >= y + half)].append(cell)
+        nw, ne, sw, se = quadrants
+        return self.__join(
+            self.__build(nw, x, y, level - 1),
+            self.__build(ne, x + half, y, level - 1),
+            self.__build(sw, x, y + half, level - 1),
+            self.__build(se, x + half, y + half, level - 1),
+        )
+
+    def __join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        """
+        returns the node with the given quadrants
+
+        Nodes are interned by this method, so joining the same quadrants always returns the same
+        node until the interned nodes are discarded. Interning a node when max_cached_nodes nodes
+        are already interned first discards all interned nodes and memoized results.
+
+        :param nw: the north-west quadrant of the node
+
+        :param ne: the north-east quadrant of the node
+
+        :param sw: the south-west quadrant of the node
+
+        :param se: the south-east quadrant of the node
+
+        :returns the node with the given quadrants
+        """
+        quadrants = (nw, ne, sw, se)
+        node = self.__nodes.get(quadrants)
+        if node is None:
+            population = nw.population + ne.population + sw.population + se.population
+            node = Node(nw.level + 1, nw, ne, sw, se, population)
+            if len(self.__nodes) >= self.__max_cached_nodes:
+                self.__nodes, self.__successors = {}, {}
+            self.__nodes[quadrants] = node
+        return node
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def __empty(level: int) -> Node:
+        """
+        returns the node of the given level with no live cells
+
+        There is only one empty node per level, so empty nodes are shared by all instances.
+
+        :param level: the level of the node
+
+        :returns the node of the given level with no live cells
+        """
+        if level == 0:
+            return HashLife.__DEAD
+        quadrant = HashLife.__empty(level - 1)
+        return Node(level, quadrant, quadrant, quadrant, quadrant, 0)
+
+    def __centre(self, node: Node) -> Node:
+        """
+        returns a node one level above the given node with the given node at its centre
+
+        :param node: a node of level 1 or greater
+
+        :returns a node one level above the given node with the given node at its centre
+        """
+        border = HashLife.__empty(node.level - 1)
+        join = self.__join
+        return join(
+            join(border, border, border, node.nw),
+            join(border, border, node.ne, border),
+            join(border, node.sw, border, border),
+            join(node.se, border, border, border),
+        )
+
+    @staticmethod
+    def __is_padded(node: Node) -> bool:
+        """
+        returns True if all live cells in the given node are in its central sixteenth
+
+        The central sixteenth of a node is the square at its centre with sides a quarter of the
+        length of the node's sides.
+
+        :param node: a node of level 3 or greater
+
+        :returns True if all live cells in the given node are in its central sixteenth
+        """
+        return (
+            node.nw.population == node.nw.se.se.population
+            and node.ne.population == node.ne.sw.sw.population
+            and node.sw.population == node.sw.ne.ne.population
+            and node.se.population == node.se.nw.nw.population
+        )
+
+    def __next_centre_of_4x4(self, node: Node) -> Node:
+        """
+        returns the 2x2 centre of the given 4x4 node advanced by 1 generation
+
+        The 4x4 grid of cells is packed into a 16-bit int, one bit per cell, so the live neighbours
+        of each centre cell are counted with a single mask rather than by visiting 8 nodes.
+
+        :param node: a node of level 2
+
+        :returns the 2x2 centre of the given 4x4 node advanced by 1 generation
+        """
+        cells = (
+            node.nw.nw, node.nw.ne, node.ne.nw, node.ne.ne,
+            node.nw.sw, node.nw.se, node.ne.sw, node.ne.se,
+            node.sw.nw, node.sw.ne, node.se.nw, node.se.ne,
+            node.sw.sw, node.sw.se, node.se.sw, node.se.se,
+        )
+        grid = 0
+        for index, cell in enumerate(cells):
+            grid |= cell.population << index
+
+        next_cells = []
+        for cell_mask, neighbourhood_mask in HashLife.__CENTRE_MASKS:
+            count = bin(grid & neighbourhood_mask).count('1')
+            is_live = grid & cell_mask
+            next_cells.append(
+                HashLife.__LIVE if count == 3 or (count == 2 and is_live) else HashLife.__DEAD
+            )
+        return self.__join(*next_cells)
+
+    def __successor(self, node: Node, step_exponent: int) -> Node:
+        """
+        returns the centre of the given node advanced by 2^step_exponent generations
+
+        The centre of a node is the node one level below it at its centre. The result is memoized
+        until the memoized results are discarded. Memoizing a result when max_cached_nodes results
+        are already memoized first discards all interned nodes and memoized results. Nodes that
+        are no longer interned are still valid, so discarding never changes a result.
+
+        :param node: a node of level 2 or greater
+
+        :param step_exponent: the base 2 logarithm of the number of generations to advance by. It
+        must not exceed node.level - 2.
+
+        :returns the centre of the given node advanced by 2^step_exponent generations
+        """
+        if node.population == 0:
+            return node.nw
+        key = (node, step_exponent)
+        result = self.__successors.get(key)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self.__next_centre_of_4x4(node)
+        else:
+            result = self.__successor_of_subnodes(node, step_exponent)
+        if len(self.__successors) >= self.__max_cached_nodes:
+            self.__nodes, self.__successors = {}, {}
+        self.__successors[key] = result
+        return result
+
+    def __successor_of_subnodes(self, node: Node, step_exponent: int) -> Node:
+        """
+        returns the centre of the given node advanced by 2^step_exponent generations
+
+        The result is computed from 9 overlapping subnodes of the given node, each advanced
+        recursively.
+
+        :param node: a node of level 3 or greater
+
+        :param step_exponent: the base 2 logarithm of the number of generations to advance by. It
+        must not exceed node.level - 2.
+
+        :returns the centre of the given node advanced by 2^step_exponent generations
+        """
+        join, successor = self.__join, self.__successor
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        subnodes = [
+            join(nw.nw, nw.ne, nw.sw, nw.se),
+            join(nw.ne, ne.nw, nw.se, ne.sw),
+            join(ne.nw, ne.ne, ne.sw, ne.se),
+            join(nw.sw, nw.se, sw.nw, sw.ne),
+            join(nw.se, ne.sw, sw.ne, se.nw),
+            join(ne.sw, ne.se, se.nw, se.ne),
+            join(sw.nw, sw.ne, sw.sw, sw.se),
+            join(sw.ne, se.nw, sw.se, se.sw),
+            join(se.nw, se.ne, se.sw, se.se),
+        ]
+        if step_exponent < node.level - 2:
+            # each subnode is advanced by the full step, so only the centre of each is needed
+            c = [successor(subnode, step_exponent) for subnode in subnodes]
+            return join(
+                join(c[0].se, c[1].sw, c[3].ne, c[4].nw),
+                join(c[1].se, c[2].sw, c[4].ne, c[5].nw),
+                join(c[3].se, c[4].sw, c[6].ne, c[7].nw),
+                join(c[4].se, c[5].sw, c[7].ne, c[8].nw),
+            )
+
+        # each subnode is advanced by half the step, and their combinations by the other half
+        c = [successor(subnode, step_exponent - 1) for subnode in subnodes]
+        return join(
+            successor(join(c[0], c[1], c[3], c[4]), step_exponent - 1),
+            successor(join(c[1], c[2], c[4], c[5]), step_exponent - 1),
+            successor(join(c[3], c[4], c[6], c[7]), step_exponent - 1),
+            successor(join(c[4], c[5], c[7], c[8]), step_exponent - 1),
+        )
+
+    @property
+    def cells(self) -> Set[Coordinate]:
+        """
+        returns the coordinates of the live cells in the world
+
+        :returns the coordinates of the live cells in the world
+        """
+        cells = set()
+        pending = [(self.__root, self.__origin.x, self.__origin.y)]
+        while pending:
+            node, x, y = pending.pop()
+            if node.population == 0:
+                continue
+            if node.level == 0:
+                cells.add(Coordinate(x, y))
+                continue
+            half = 1 << (node.level - 1)
+            pending += [
+                (node.nw, x, y),
+                (node.ne, x + half, y),
+                (node.sw, x, y + half),
+                (node.se, x + half, y + half),
+            ]
+        return cells
+
+    @property
+    def cached_node_count(self) -> int:
+        """
+        returns the number of nodes currently interned
+
+        :returns the number of nodes currently interned
+        """
+        return len(self.__nodes)
+
+    def advance(self, generations: int) -> None:
+        """
+        updates the world by applying the rules of the game the given number of times
+
+        The world is advanced by each power of 2 in the binary expansion of generations in turn.
+        Before each advance, the root node is padded with empty space until it is large enough
+        that no live cell can leave its centre during the advance.
+
+        :param generations: the number of generations to advance the world by
+
+        :returns None
+        """
+        root, origin = self.__root, self.__origin
+        for step_exponent in range(generations.bit_length()):
+            if not generations >> step_exponent & 1:
+                continue
+            while root.level < step_exponent + 3 or not HashLife.__is_padded(root):
+                offset = 1 << (root.level - 1)
+                root = self.__centre(root)
+                origin = Coordinate(origin.x - offset, origin.y - offset)
+            offset = 1 << (root.level - 2)
+            root = self.__successor(root, step_exponent)
+            origin = Coordinate(origin.x + offset, origin.y + offset)
+        self.__root, self.__origin = root, origin
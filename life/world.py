@@ -1,46 +1,122 @@
 import collections
-import functools
 import operator
-from typing import List, Set
+from typing import FrozenSet, Optional, Set
 from life.coordinate import Coordinate
+from life.hashlife import HashLife
+
+# Coordinates are packed into a single int as x * base + y. Adding a packed offset to a packed
+# coordinate offsets both components at once, so the neighbours of a live cell can be found with one
+# int addition each rather than by building a tuple. The packing is only lossless while every
+# y-component lies in the interval [-base / 2, base / 2), so each World picks a base from the extent
+# of its state, never smaller than _PACKING_BASE, and picks it again before any cell can leave that
+# interval, with room for at least as many generations again as the largest y-component.
+_PACKING_BASE = 2 ** 32
+_PACKING_BIAS = 2 ** 31
 
 class World:
     """
     represents a 2D world in grid form with each cell in the grid being live or dead (but not both)
 
     fields:
-        state: Set[Coordinate]
-            represents the state of the world as a set of 2-integer tuples. Each element of the set
-            gives the coordinates of a live cell in the grid. As such, the coordinates of dead cells
-            are not part of the state.
+        state: FrozenSet[Coordinate]
+            represents the state of the world as a frozen set of 2-integer tuples. Each element of
+            the set gives the coordinates of a live cell in the grid. As such, the coordinates of
+            dead cells are not part of the state.
+
+        backend: str
+            the algorithm used to apply the rules of the game. With 'hashset', each generation is
+            computed by counting the live neighbours of each live cell. With 'hashlife', the state
+            is stored in a HashLife quadtree, which is much faster when advancing long-running
+            patterns by many generations at once.
+
+        dimensions: Optional[Coordinate]
+            the width and height of the world if it is a toroidal grid, or None if the world is an
+            unbounded plane. On a toroidal grid, each coordinate is taken modulo dimensions, so
+            cells on one edge of the grid neighbour the cells on the opposing edge.
 
     methods:
         next_state() -> None
             updates state by applying the rules of the game
 
-        state() -> Set[Coordinate]
+        advance(generations: int) -> None
+            updates state by applying the rules of the game the given number of times
+
+        state() -> FrozenSet[Coordinate]
             returns state
     """
 
-    def __init__(self, initial_state: Set[Coordinate]) -> None:
+    __BACKENDS = ('hashset', 'hashlife')
+
+    def __init__(
+            self, initial_state: Set[Coordinate], backend: str = 'hashset',
+            dimensions: Optional[Coordinate] = None
+    ) -> None:
         """
         instantiates a World
 
-        :param initial_state: an initial state of the World
+        :raises ValueError if backend is not one of 'hashset' or 'hashlife'
+
+        :raises ValueError if dimensions is given and backend is 'hashlife'
+
+        :param initial_state: an initial state of the World. If dimensions is given, each
+        coordinate in initial_state is taken modulo dimensions.
+
+        :param backend: the algorithm used to apply the rules of the game
+
+        :param dimensions: the width and height of the world if it is a toroidal grid, or None if
+        the world is an unbounded plane
+
+        :returns None
+        """
+        if backend not in World.__BACKENDS:
+            raise ValueError("The backend must be one of 'hashset' or 'hashlife'.")
+        if dimensions is not None:
+            if backend == 'hashlife':
+                raise ValueError("The 'hashlife' backend does not support a toroidal grid.")
+            World.__validate_dimensions(dimensions)
+        self.__backend = backend
+        self.__dimensions = dimensions
+        self.__unpacked_state = None
+        max_y_magnitude = World.__validate_state(initial_state)
+        if backend == 'hashlife':
+            self.__state, self.__hashlife = None, HashLife(initial_state)
+        else:
+            packed_state = self.__pack_state(initial_state, max_y_magnitude)
+            if dimensions is not None:
+                packed_state = set(self.__wrap(collections.Counter(packed_state)))
+            self.__state, self.__hashlife = packed_state, None
+
+    @staticmethod
+    def __validate_dimensions(dimensions: Coordinate) -> None:
+        """
+        validates given dimensions
+
+        :raises TypeError if dimensions is not of type Coordinate
+
+        :raises TypeError if any element of dimensions is not of type int
+
+        :raises ValueError if any element of dimensions is not positive
+
+        :param dimensions: the width and height of a toroidal grid
 
         :returns None
         """
-        World.__validate_state(initial_state)
-        self.__state = initial_state
+        if type(dimensions) is not Coordinate:
+            raise TypeError("The dimensions must be of type Coordinate.")
+        if any(type(dimension) is not int for dimension in dimensions):
+            raise TypeError("The dimensions must contain only elements of type int.")
+        if any(dimension < 1 for dimension in dimensions):
+            raise ValueError("The dimensions must be positive.")
 
     @staticmethod
-    def __validate_state(state: Set[Coordinate]) -> None:
+    def __validate_state(state: Set[Coordinate]) -> int:
         """
-        validates a given state
+        validates a given state and returns the largest magnitude of its y-components
 
-        checks that state is of type Set[Coordinate]
+        checks that state is of type Set[Coordinate] or FrozenSet[Coordinate]. The largest
+        magnitude is found in the same pass, so the state is only iterated once before packing.
 
-        :raises TypeError if state is not of type Set
+        :raises TypeError if state is not of type Set or FrozenSet
 
         :raises TypeError if any element of state is not of type Coordinate
 
@@ -48,65 +124,201 @@ class World:
 
         :param state: a state for the World
 
-        :returns None
+        :returns the largest magnitude of the y-components of state, or 0 if state is empty
         """
-        error_message = "The state must be of type Set[Coordinate]. "
+        error_message = "The state must be of type Set[Coordinate] or FrozenSet[Coordinate]. "
 
-        if type(state) is not set:
-            error_message += "The collection used is not of type set."
+        if type(state) is not set and type(state) is not frozenset:
+            error_message += "The collection used is not of type set or frozenset."
             raise TypeError(error_message)
 
+        max_y_magnitude = 0
+
         for coordinate in state:
             if type(coordinate) is not Coordinate:
                 error_message += "An element of the set is not a Coordinate."
                 raise TypeError(error_message)
-            for component in coordinate:
-                if type(component) is not int:
-                    error_message += "A Coordinate in the set contains an element that is not of type int."
-                    raise TypeError(error_message)
+            x, y = coordinate
+            if type(x) is not int or type(y) is not int:
+                error_message += "A Coordinate in the set contains an element that is not of type int."
+                raise TypeError(error_message)
+            if y > max_y_magnitude:
+                max_y_magnitude = y
+            elif -y > max_y_magnitude:
+                max_y_magnitude = -y
+        return max_y_magnitude
+
+    def __pack_state(self, state: Set[Coordinate], max_y_magnitude: int) -> Set[int]:
+        """
+        returns the given state with each coordinate packed into a single int
+
+        The packing base is chosen so that the y-component of every coordinate in state, and of
+        every neighbour of those coordinates, can be packed losslessly. As a live cell can move at
+        most one cell per generation, this also gives the number of generations that can be
+        computed before the state must be packed again. On a toroidal grid, no coordinate ever
+        leaves the grid, so the state never has to be packed again.
+
+        :param state: a valid state for the World
+
+        :param max_y_magnitude: the largest magnitude of the y-components of state
+
+        :returns the given state with each coordinate packed into a single int
+        """
+        if self.__dimensions is not None:
+            max_y_magnitude = max(max_y_magnitude, self.__dimensions.y)
+        # one bit more than the y-components need, so each packing lasts for at least as many
+        # generations as the largest y-component
+        bias = max(_PACKING_BIAS, 1 << ((max_y_magnitude + 1).bit_length() + 1))
+        base = 2 * bias
+        self.__packing_base = base
+        # packed offsets from a cell to each cell in its Moore neighbourhood (the 8 closest other
+        # cells)
+        self.__neighbour_offsets = tuple(
+            x_offset * base + y_offset
+            for x_offset in range(-1, 2)
+            for y_offset in range(-1, 2)
+            if not (x_offset == y_offset == 0)
+        )
+        if self.__dimensions is None:
+            self.__generations_until_repacking = bias - max_y_magnitude - 1
+        else:
+            self.__generations_until_repacking = None
+        return {x * base + y for x, y in state}
+
+    def __unpack(self, packed_coordinate: int) -> Coordinate:
+        """
+        returns the coordinate packed into the given int
+
+        :param packed_coordinate: a coordinate packed into a single int by __pack_state
+
+        :returns the coordinate packed into the given int
+        """
+        bias = self.__packing_base // 2
+        x, y = divmod(packed_coordinate + bias, self.__packing_base)
+        return Coordinate(x, y - bias)
+
+    def __wrap(self, counted_cells: collections.Counter) -> collections.Counter:
+        """
+        returns the given counts of packed coordinates with each coordinate taken modulo dimensions
+
+        If the world is an unbounded plane, the given counts are returned as they are. Otherwise
+        the counts of coordinates off the grid are added to the counts of their equivalent
+        coordinates on the grid. Only coordinates next to the edges of the grid can be off it, so
+        every other coordinate is kept by a cheap range check rather than being unpacked.
+
+        :param counted_cells: counts of packed coordinates
+
+        :returns the given counts of packed coordinates with each coordinate taken modulo dimensions
+        """
+        if self.__dimensions is None:
+            return counted_cells
+
+        width, height = self.__dimensions
+        base = self.__packing_base
+        packed_width = width * base
+        off_grid = [
+            packed_coordinate for packed_coordinate in counted_cells
+            if not 0 <= packed_coordinate < packed_width or packed_coordinate % base >= height
+        ]
+        for packed_coordinate in off_grid:
+            x, y = self.__unpack(packed_coordinate)
+            wrapped_coordinate = x % width * base + y % height
+            counted_cells[wrapped_coordinate] += counted_cells.pop(packed_coordinate)
+        return counted_cells
 
     @property
-    def state(self) -> Set[Coordinate]:
+    def state(self) -> FrozenSet[Coordinate]:
         """
         returns state
 
+        The unpacked state is cached until the state is next updated, so repeated accesses within
+        a generation do not unpack every live cell again. The cached state is frozen so that it
+        cannot be changed by the caller.
+
         :returns state
         """
-        return self.__state
+        if self.__unpacked_state is None:
+            if self.__hashlife is not None:
+                self.__unpacked_state = frozenset(self.__hashlife.cells)
+            else:
+                self.__unpacked_state = frozenset(
+                    self.__unpack(packed_coordinate) for packed_coordinate in self.__state
+                )
+        return self.__unpacked_state
 
     def next_state(self) -> None:
         """
         updates state by applying the rules of the game
 
+        Live neighbours are counted in a single pass over the packed live cells, so finding each
+        neighbour of a live cell takes a single int addition. If a live cell could be next to the
+        edge of the interval of y-components that can be packed, the state is first packed again
+        with a larger base.
+
         :returns None
         """
-        def get_neighbours(coordinates: List[Coordinate]) -> List[Coordinate]:
-            """
-            returns the coordinates of the neighbours of the coordinates in the given list
-
-            The neighbourhood around a given coordinate is defined to be the the Moore neighbourhood
-            around that coordinate. In other words, the neighbourhood around a given coordinate is
-            the 8 closest other coordinates.
-
-            :param coordinates: a list of tuples of form (x, y) giving the coordinate of a live cell
-                   in state
-
-            :returns the coordinates of the neighbours of the coordinates in the given list
-            """
-            offset = range(-1, 2)
-            neighbours = [
-                Coordinate(coordinate.x + x_offset, coordinate.y + y_offset)
-                for coordinate in coordinates
-                for x_offset in offset
-                for y_offset in offset
-                if not (x_offset == y_offset == 0)
-            ]
-            return neighbours
-
-        neighbours = get_neighbours(self.state)
-        counted_neighbours = collections.Counter(neighbours)
+        self.__unpacked_state = None
+        if self.__hashlife is not None:
+            self.__hashlife.advance(1)
+            return
+
+        if self.__generations_until_repacking == 0:
+            state = {self.__unpack(packed_coordinate) for packed_coordinate in self.__state}
+            max_y_magnitude = max(map(abs, map(operator.itemgetter(1), state)), default=0)
+            self.__state = self.__pack_state(state, max_y_magnitude)
+        if self.__generations_until_repacking is not None:
+            self.__generations_until_repacking -= 1
+
+        live_cells = self.__state
+        counted_neighbours = self.__wrap(collections.Counter(
+            packed_coordinate + offset
+            for packed_coordinate in live_cells
+            for offset in self.__neighbour_offsets
+        ))
         next_state = {
-            coordinate for coordinate, count in counted_neighbours.items()
-            if count == 3 or (count == 2 and coordinate in self.__state)
+            packed_coordinate for packed_coordinate, count in counted_neighbours.items()
+            if count == 3 or (count == 2 and packed_coordinate in live_cells)
         }
         self.__state = next_state
+
+    @property
+    def backend(self) -> str:
+        """
+        returns backend
+
+        :returns backend
+        """
+        return self.__backend
+
+    def advance(self, generations: int) -> None:
+        """
+        updates state by applying the rules of the game the given number of times
+
+        :raises TypeError if generations is not of type int
+
+        :raises ValueError if generations is negative
+
+        :param generations: the number of generations to advance the World by
+
+        :returns None
+        """
+        if type(generations) is not int:
+            raise TypeError("The number of generations must be of type int.")
+        if generations < 0:
+            raise ValueError("The number of generations cannot be negative.")
+
+        if self.__hashlife is not None:
+            self.__unpacked_state = None
+            self.__hashlife.advance(generations)
+            return
+        for _ in range(generations):
+            self.next_state()
+
+    @property
+    def dimensions(self) -> Optional[Coordinate]:
+        """
+        returns dimensions
+
+        :returns dimensions
+        """
+        return self.__dimensions
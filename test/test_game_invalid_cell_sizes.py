@@ -10,6 +10,11 @@ class TestGameInvalidCellSizes():
             cell_size, initial_state = -1, set()
             Game(cell_size, initial_state)
 
+    def test_cell_size_is_zero(self):
+        with pytest.raises(ValueError):
+            cell_size, initial_state = 0, set()
+            Game(cell_size, initial_state)
+
     def test_cell_size_is_too_long(self):
         pygame.init()
         screen_width = pygame.display.Info().current_w
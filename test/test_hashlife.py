@@ -0,0 +1,29 @@
+from life.hashlife import HashLife
+from life.world import World
+from life.coordinate import Coordinate
+
+
+class TestHashLife():
+    def test_discarding_cached_nodes_keeps_results(self):
+        starting_state = {Coordinate(*c) for c in {(1, 0), (2, 0), (0, 1), (1, 1), (1, 2)}}
+        world = World(starting_state)
+        hashlife = HashLife(starting_state, max_cached_nodes=1000)
+        for i in range(100):
+            world.next_state()
+            hashlife.advance(1)
+            assert hashlife.cached_node_count <= 1000
+        assert world.state == hashlife.cells
+
+    def test_discarding_cached_nodes_during_an_advance_keeps_results(self):
+        starting_state = {Coordinate(*c) for c in {(1, 0), (2, 0), (0, 1), (1, 1), (1, 2)}}
+        world = World(starting_state)
+        world.advance(2 ** 8)
+        hashlife = HashLife(starting_state, max_cached_nodes=1000)
+        hashlife.advance(2 ** 8)
+        assert hashlife.cached_node_count <= 1000
+        assert world.state == hashlife.cells
+
+    def test_cached_nodes_are_not_shared(self):
+        starting_state = {Coordinate(*c) for c in {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}}
+        HashLife(starting_state).advance(100)
+        assert 0 == HashLife(set()).cached_node_count
@@ -0,0 +1,55 @@
+from life.world import World
+from life.coordinate import Coordinate
+import pytest
+
+
+class TestWorldHashLife():
+    def test_backends_agree_on_r_pentomino(self):
+        starting_state = {Coordinate(*c) for c in {(1, 0), (2, 0), (0, 1), (1, 1), (1, 2)}}
+        hashset_world = World(starting_state)
+        hashlife_world = World(starting_state, backend='hashlife')
+        for generations in [1, 1, 2, 3, 5, 8, 13, 21, 34, 55]:
+            hashset_world.advance(generations)
+            hashlife_world.advance(generations)
+            assert hashset_world.state == hashlife_world.state
+
+    def test_backends_agree_on_next_state(self):
+        starting_state = {Coordinate(*c) for c in {(2, 3), (3, 1), (2, 1), (2, 2)}}
+        hashset_world = World(starting_state)
+        hashlife_world = World(starting_state, backend='hashlife')
+        for i in range(20):
+            hashset_world.next_state()
+            hashlife_world.next_state()
+            assert hashset_world.state == hashlife_world.state
+
+    def test_glider_advances_many_generations(self):
+        starting_state = {Coordinate(*c) for c in {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}}
+        world = World(starting_state, backend='hashlife')
+        world.advance(2 ** 40)
+        next_state = world.state
+        offset = 2 ** 38
+        expected_state = {Coordinate(x + offset, y + offset) for x, y in starting_state}
+        assert expected_state == next_state
+
+    def test_state_after_many_generations_is_valid(self):
+        starting_state = {Coordinate(*c) for c in {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}}
+        world = World(starting_state, backend='hashlife')
+        world.advance(2 ** 40)
+        next_world = World(world.state, backend='hashlife')
+        world.advance(4)
+        next_world.advance(4)
+        assert world.state == next_world.state
+
+    def test_empty_state(self):
+        world = World(set(), backend='hashlife')
+        world.advance(1000)
+        assert set() == world.state
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            World(set(), backend='dense')
+
+    def test_negative_generations(self):
+        world = World(set(), backend='hashlife')
+        with pytest.raises(ValueError):
+            world.advance(-1)
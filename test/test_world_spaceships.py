@@ -0,0 +1,98 @@
+from life.world import World
+from life.coordinate import Coordinate
+import pytest
+
+
+class TestWorldSpaceships():
+    def test_glider_start_state(self):
+        starting_state = {Coordinate(*c) for c in {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}}
+        world = World(starting_state)
+        for i in range(4):
+            world.next_state()
+        next_state = world.state
+        expected_state = {Coordinate(x + 1, y + 1) for x, y in starting_state}
+        assert expected_state == next_state
+
+    def test_glider_travels_far_from_origin(self):
+        starting_state = {Coordinate(*c) for c in {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}}
+        world = World(starting_state)
+        for i in range(4000):
+            world.next_state()
+        next_state = world.state
+        expected_state = {Coordinate(x + 1000, y + 1000) for x, y in starting_state}
+        assert expected_state == next_state
+
+    def test_lightweight_spaceship_start_state(self):
+        starting_state = {
+            Coordinate(*c)
+            for c in {(1, 0), (4, 0), (0, 1), (0, 2), (4, 2), (0, 3), (1, 3), (2, 3), (3, 3)}
+        }
+        world = World(starting_state)
+        for i in range(4):
+            world.next_state()
+        next_state = world.state
+        expected_state = {Coordinate(x - 2, y) for x, y in starting_state}
+        assert expected_state == next_state
+
+    def test_glider_crosses_large_positive_y_component(self):
+        origin = Coordinate(0, 2 ** 31 - 5)
+        starting_state = {
+            Coordinate(origin.x + x, origin.y + y)
+            for x, y in {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}
+        }
+        world = World(starting_state)
+        for i in range(40):
+            world.next_state()
+        next_state = world.state
+        expected_state = {Coordinate(x + 10, y + 10) for x, y in starting_state}
+        assert expected_state == next_state
+
+    def test_glider_matches_each_generation_across_large_y_components(self):
+        glider = {Coordinate(*c) for c in {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}}
+        reference_world = World(glider)
+        for y_offset in [2 ** 31 - 5, 2 ** 32 - 5, 2 ** 33 - 5]:
+            world = World({Coordinate(x, y + y_offset) for x, y in glider})
+            for i in range(40):
+                world.next_state()
+                reference_world.next_state()
+                next_state = world.state
+                expected_state = {Coordinate(x, y + y_offset) for x, y in reference_world.state}
+                assert expected_state == next_state
+            reference_world = World(glider)
+
+    def test_glider_matches_each_generation_across_repacking(self, monkeypatch):
+        # a small minimum packing bias makes the state be packed again every few generations
+        monkeypatch.setattr('life.world._PACKING_BIAS', 4)
+        glider = {Coordinate(*c) for c in {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}}
+        world = World(glider)
+        for i in range(1, 101):
+            world.next_state()
+            offset = i // 4
+            expected_state = World(glider)
+            expected_state.advance(i % 4)
+            expected_state = {Coordinate(x + offset, y + offset) for x, y in expected_state.state}
+            assert expected_state == world.state
+
+    def test_glider_crosses_large_negative_y_component(self):
+        origin = Coordinate(0, -2 ** 31 + 5)
+        starting_state = {
+            Coordinate(origin.x + x, origin.y - y)
+            for x, y in {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}
+        }
+        world = World(starting_state)
+        for i in range(40):
+            world.next_state()
+        next_state = world.state
+        expected_state = {Coordinate(x + 10, y - 10) for x, y in starting_state}
+        assert expected_state == next_state
+
+    def test_glider_with_very_large_y_component(self):
+        starting_state = {
+            Coordinate(x, 2 ** 70 + y) for x, y in {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}
+        }
+        world = World(starting_state)
+        for i in range(4):
+            world.next_state()
+        next_state = world.state
+        expected_state = {Coordinate(x + 1, y + 1) for x, y in starting_state}
+        assert expected_state == next_state
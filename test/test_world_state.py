@@ -0,0 +1,21 @@
+from life.world import World
+from life.coordinate import Coordinate
+import pytest
+
+
+class TestWorldState():
+    def test_state_cannot_be_changed(self):
+        starting_state = {Coordinate(*c) for c in {(0, 1), (0, 2), (0, 3)}}
+        world = World(starting_state)
+        with pytest.raises(AttributeError):
+            world.state.add(Coordinate(5, 5))
+        assert starting_state == world.state
+
+    def test_state_as_start_state(self):
+        starting_state = {Coordinate(*c) for c in {(0, 1), (0, 2), (0, 3)}}
+        world = World(starting_state)
+        world.next_state()
+        next_world = World(world.state)
+        world.next_state()
+        next_world.next_state()
+        assert world.state == next_world.state
@@ -0,0 +1,59 @@
+from life.world import World
+from life.coordinate import Coordinate
+import pytest
+
+
+class TestWorldToroidal():
+    def test_start_state_is_wrapped(self):
+        starting_state = {Coordinate(*c) for c in {(-1, 0), (5, 7), (2, -3)}}
+        world = World(starting_state, dimensions=Coordinate(5, 5))
+        expected_state = {Coordinate(*c) for c in {(4, 0), (0, 2), (2, 2)}}
+        assert expected_state == world.state
+
+    def test_row_across_edge(self):
+        starting_state = {Coordinate(*c) for c in {(4, 2), (0, 2), (1, 2)}}
+        world = World(starting_state, dimensions=Coordinate(5, 5))
+        world.next_state()
+        next_state = world.state
+        expected_state = {Coordinate(*c) for c in {(0, 1), (0, 2), (0, 3)}}
+        assert expected_state == next_state
+        world.next_state()
+        next_state = world.state
+        assert starting_state == next_state
+
+    def test_column_across_corner(self):
+        starting_state = {Coordinate(*c) for c in {(0, 5), (0, 0), (0, 1)}}
+        world = World(starting_state, dimensions=Coordinate(6, 6))
+        world.next_state()
+        next_state = world.state
+        expected_state = {Coordinate(*c) for c in {(5, 0), (0, 0), (1, 0)}}
+        assert expected_state == next_state
+
+    def test_glider_returns_to_start(self):
+        starting_state = {Coordinate(*c) for c in {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}}
+        world = World(starting_state, dimensions=Coordinate(8, 8))
+        for i in range(4 * 8):
+            world.next_state()
+        next_state = world.state
+        assert starting_state == next_state
+
+    def test_row_across_edge_at_large_heights(self):
+        for height in [2 ** 31 - 1, 2 ** 31, 2 ** 40]:
+            starting_state = {Coordinate(x, height - 1) for x in range(3)}
+            world = World(starting_state, dimensions=Coordinate(10, height))
+            world.next_state()
+            next_state = world.state
+            expected_state = {Coordinate(*c) for c in {(1, height - 2), (1, height - 1), (1, 0)}}
+            assert expected_state == next_state
+
+    def test_dimensions_are_not_positive(self):
+        with pytest.raises(ValueError):
+            World(set(), dimensions=Coordinate(0, 5))
+
+    def test_dimensions_contain_non_int(self):
+        with pytest.raises(TypeError):
+            World(set(), dimensions=Coordinate(5, '5'))
+
+    def test_hashlife_backend(self):
+        with pytest.raises(ValueError):
+            World(set(), backend='hashlife', dimensions=Coordinate(5, 5))